@@ -45,6 +45,10 @@ class GeneticsService:
     def __init__(self):
         self.populations: Dict[str, Population] = {}
         self.mice: Dict[str, Mouse] = {}
+        # Every mouse seen so far by integer ID, ancestors included: the
+        # pedigree functions treat parents missing from a registry as
+        # unrelated founders, so they need the whole pedigree, not a selection
+        self.mouse_registry: Dict[int, Mouse] = {}
         self.gene_models = load_gene_models()
     
     def create_population(self, size: int, goal_preset: str, name: Optional[str] = None) -> Tuple[str, Population]:
@@ -58,6 +62,7 @@ class GeneticsService:
         # Store individual mice
         for mouse in pop.mice:
             self.mice[str(mouse.id)] = mouse
+        self.mouse_registry.update(pop.mouse_registry)
         
         return pop_id, pop
     
@@ -89,6 +94,7 @@ class GeneticsService:
         # Add/update all current mice in the population
         for mouse in pop.mice:
             self.mice[str(mouse.id)] = mouse
+        self.mouse_registry.update(pop.mouse_registry)
     
     def breed_mice(self, parent1_id: str, parent2_id: str, n_offspring: int = 1) -> List[Mouse]:
         """Breed two mice and return offspring."""
@@ -104,6 +110,7 @@ class GeneticsService:
         # Store offspring
         for mouse in offspring:
             self.mice[str(mouse.id)] = mouse
+            self.mouse_registry[mouse.id] = mouse
 
         return offspring
     
@@ -128,11 +135,14 @@ class GeneticsService:
         # Create temporary population
         pop = Population(size=0, goal=GoalPresets.LARGE_FRIENDLY)
         pop.mice = mice
-        # Build registry mapping integer IDs -> Mouse objects for pedigree functions
-        registry = {m.id: m for m in mice}
-
-        # Compute pedigree-based inbreeding using function from mouse_breeder
-        f_pedigree_values = [mouse_breeder.pedigree_inbreeding(m, registry) for m in mice]
+        # Pedigree functions need the selected mice's ancestors too, so use
+        # the full registry (its kinship table is reused across requests)
+        registry = self.mouse_registry
+        registry.update((m.id, m) for m in mice if m.id not in registry)
+
+        # Compute pedigree-based inbreeding for all selected mice in one pass
+        f_by_id = mouse_breeder.pedigree_inbreeding_all(registry)
+        f_pedigree_values = [f_by_id[m.id] for m in mice]
         
         # Compute GRM for genomic inbreeding
         grm = pop.compute_grm()
@@ -33,10 +33,43 @@ Directory structure:
         cleaned/      - Processed files (cleaned_*.csv)
 """
 
+import contextlib
 import csv
+import io
+import itertools
+import operator
 import os
 import glob
+import re
 import hashlib
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+# Strain columns are the quoted header fields, e.g. "C57BL/6J"; group 1 is
+# the name without quotes
+_STRAIN_COLUMN_RE = re.compile(r'"+(.*?)"+')
+
+# Column header of the cleaned genotype files read by the simulator
+CLEANED_HEADER = ['strain', 'chr', 'pos', 'genotype_012']
+
+# SNPs parsed, encoded and written per step when processing a raw file
+STREAM_CHUNK_SIZE = 10000
+
+# Read size for hashing raw files: large reads keep multi-GB MPD dumps from
+# being dominated by per-call overhead
+HASH_CHUNK_SIZE = 1 << 20
+
+# Suffix of a cleaned file still being written by process_file
+PARTIAL_SUFFIX = '.partial'
+
+# Write buffer for cleaned CSV output (the default is 8 KiB)
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Sidecar recording which cleaned files the combined dataset was built from
+COMBINED_KEY_FILENAME = '.combined.key'
+
+# Read size for appending cleaned files into the combined dataset
+COPY_CHUNK_SIZE = 1 << 20
 
 
 def get_file_hash(filepath):
@@ -51,7 +84,7 @@ def get_file_hash(filepath):
     """
     hash_md5 = hashlib.md5()
     with open(filepath, 'rb') as f:
-        for chunk in iter(lambda: f.read(4096), b""):
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
             hash_md5.update(chunk)
     return hash_md5.hexdigest()
 
@@ -91,7 +124,8 @@ def find_cleaned_files(cleaned_dir='datasets/cleaned'):
         List of cleaned CSV file paths
     """
     # Look for cleaned CSV files
-    csv_files = glob.glob(os.path.join(cleaned_dir, 'cleaned_*.csv'))
+    csv_files = [os.path.join(cleaned_dir, name)
+                 for name in list_cleaned_names(cleaned_dir)]
 
     if csv_files:
         print(f"Found {len(csv_files)} cleaned file(s) in {cleaned_dir}/:")
@@ -103,6 +137,27 @@ def find_cleaned_files(cleaned_dir='datasets/cleaned'):
     return csv_files
 
 
+def list_cleaned_names(cleaned_dir='datasets/cleaned'):
+    """
+    List the cleaned_*.csv file names in the cleaned folder.
+
+    One directory read serves every lookup, instead of a stat per file.
+
+    Args:
+        cleaned_dir: Path to cleaned data folder
+
+    Returns:
+        List of cleaned file names (without directory), empty if the folder
+        does not exist
+    """
+    try:
+        with os.scandir(cleaned_dir) as entries:
+            return [entry.name for entry in entries
+                    if entry.name.startswith('cleaned_') and entry.name.endswith('.csv')]
+    except FileNotFoundError:
+        return []
+
+
 def get_cleaned_filename(raw_filepath, cleaned_dir='datasets/cleaned'):
     """
     Generate cleaned filename from raw filename.
@@ -139,12 +194,13 @@ def identify_new_files(raw_files, cleaned_dir='datasets/cleaned'):
     """
     new_files = []
 
-    for raw_file in raw_files:
-        # Get expected cleaned filename
-        cleaned_file = get_cleaned_filename(raw_file, cleaned_dir)
+    # Cleaned files already on disk, read once for set lookups
+    existing = set(list_cleaned_names(cleaned_dir))
 
+    for raw_file in raw_files:
         # Check if cleaned version exists
-        if not os.path.exists(cleaned_file):
+        cleaned_name = os.path.basename(get_cleaned_filename(raw_file, cleaned_dir))
+        if cleaned_name not in existing:
             print(f"  ✓ {os.path.basename(raw_file)} - needs processing (no cleaned version)")
             new_files.append(raw_file)
         else:
@@ -153,48 +209,57 @@ def identify_new_files(raw_files, cleaned_dir='datasets/cleaned'):
     return new_files
 
 
-def parse_mpd_csv(input_path):
+def _read_mpd_snps(f):
     """
-    Step 4: Parse the MPD CSV file and extract relevant columns.
+    Read an MPD CSV header from an open file and return a lazy SNP reader.
 
-    This parser is flexible and handles any MPD CSV naming format.
-    It automatically detects strain columns (quoted column names).
+    Data rows are only read as the returned iterator is consumed, so a
+    caller can stream a file of any size.
 
     Args:
-        input_path: Path to input CSV file
+        f: Text file positioned at the start of an MPD CSV
 
     Returns:
-        Tuple of (snp_data, strain_columns)
-        - snp_data: List of dicts with keys: chr, pos, strain_alleles
+        Tuple of (strain_columns, snps)
         - strain_columns: List of strain names found
+        - snps: Iterator of (chr, pos, strain_alleles) tuples; empty if the
+          required columns are missing
     """
-    snp_data = []
-
-    print(f"\nParsing: {os.path.basename(input_path)}")
-
-    with open(input_path, 'r', encoding='utf-8') as f:
-        # Read header line manually to preserve quotes
-        header_line = f.readline().strip()
-        headers = header_line.split(',')
-
-        # Identify strain columns (those with quotes, e.g., "C57BL/6J")
-        strain_columns = []
-        strain_indices = []
-        for i, col in enumerate(headers):
-            if col.startswith('"') and col.endswith('"'):
-                strain_columns.append(col.strip('"'))
-                strain_indices.append(i)
-
-        print(f"  Detected {len(strain_columns)} strain(s): {', '.join(strain_columns)}")
+    # Read header line manually to preserve quotes
+    header_line = f.readline().strip()
+    headers = header_line.split(',')
+
+    # Identify strain columns (those with quotes, e.g., "C57BL/6J")
+    strain_columns = []
+    strain_indices = []
+    for i, col in enumerate(headers):
+        match = _STRAIN_COLUMN_RE.fullmatch(col)
+        if match:
+            strain_columns.append(match.group(1))
+            strain_indices.append(i)
+
+    print(f"  Detected {len(strain_columns)} strain(s): {', '.join(strain_columns)}")
+
+    # Find indices for chr and bp38 (genomic position)
+    try:
+        chr_idx = headers.index('chr')
+        pos_idx = headers.index('bp38')
+    except ValueError as e:
+        print(f"  ERROR: Required column not found: {e}")
+        return [], iter(())
+
+    # Strain columns are read together: itemgetter pulls all of a row's
+    # allele fields in one call (wrapped so one strain still gives a tuple)
+    if len(strain_indices) > 1:
+        get_alleles = operator.itemgetter(*strain_indices)
+    else:
+        get_alleles = lambda row: tuple(row[idx] for idx in strain_indices)
+    min_fields = max(strain_indices, default=-1) + 1
 
-        # Find indices for chr and bp38 (genomic position)
-        try:
-            chr_idx = headers.index('chr')
-            pos_idx = headers.index('bp38')
-        except ValueError as e:
-            print(f"  ERROR: Required column not found: {e}")
-            return [], []
+    # Only ~20 chromosomes, so each "chrN" name is built once and shared
+    chr_names = {}
 
+    def snps():
         # Read data rows
         for line in f:
             line = line.strip()
@@ -204,8 +269,10 @@ def parse_mpd_csv(input_path):
             fields = line.split(',')
 
             # Extract chromosome number (convert to "chr8" format)
-            chr_num = fields[chr_idx].strip()
-            chr_name = f"chr{chr_num}"
+            chr_num = fields[chr_idx]
+            chr_name = chr_names.get(chr_num)
+            if chr_name is None:
+                chr_name = chr_names[chr_num] = f"chr{chr_num.strip()}"
 
             # Extract genomic position (bp38 = GRCm38/mm10 assembly)
             try:
@@ -213,27 +280,105 @@ def parse_mpd_csv(input_path):
             except (ValueError, IndexError):
                 continue
 
-            # Extract alleles for each strain
-            strain_alleles = {}
-            for strain_name, idx in zip(strain_columns, strain_indices):
-                if idx < len(fields):
-                    allele = fields[idx].strip()
-                    # Skip empty alleles
-                    if allele:
-                        strain_alleles[strain_name] = allele
+            # Extract alleles for each strain (skipping empty ones); short
+            # rows only have the strain columns they reach
+            if len(fields) >= min_fields:
+                alleles = map(str.strip, get_alleles(fields))
+            else:
+                alleles = (fields[idx].strip() if idx < len(fields) else ''
+                           for idx in strain_indices)
+            strain_alleles = {strain_name: allele
+                              for strain_name, allele in zip(strain_columns, alleles)
+                              if allele}
 
             # Only keep SNPs where we have data for at least one strain
             if strain_alleles:
-                snp_data.append({
-                    'chr': chr_name,
-                    'pos': pos,
-                    'strain_alleles': strain_alleles
-                })
+                yield chr_name, pos, strain_alleles
+
+    return strain_columns, snps()
+
+
+def parse_mpd_csv(input_path):
+    """
+    Step 4: Parse the MPD CSV file and extract relevant columns.
+
+    This parser is flexible and handles any MPD CSV naming format.
+    It automatically detects strain columns (quoted column names).
+
+    Args:
+        input_path: Path to input CSV file
 
-    print(f"  Extracted {len(snp_data)} SNP(s)")
+    Returns:
+        Tuple of (snp_data, strain_columns)
+        - snp_data: Dict of parallel columns, one entry per SNP:
+          chr (list of names), pos (array of ints), strain_alleles (list of
+          strain -> allele dicts)
+        - strain_columns: List of strain names found
+    """
+    # Column layout: no per-SNP record dict, and positions packed as
+    # machine ints
+    snp_data = {'chr': [], 'pos': array('q'), 'strain_alleles': []}
+    chr_col = snp_data['chr']
+    pos_col = snp_data['pos']
+    alleles_col = snp_data['strain_alleles']
+
+    print(f"\nParsing: {os.path.basename(input_path)}")
+
+    with open(input_path, 'r', encoding='utf-8') as f:
+        strain_columns, snps = _read_mpd_snps(f)
+        for chr_name, pos, strain_alleles in snps:
+            chr_col.append(chr_name)
+            pos_col.append(pos)
+            alleles_col.append(strain_alleles)
+
+    print(f"  Extracted {len(pos_col)} SNP(s)")
     return snp_data, strain_columns
 
 
+def _allele_codes(alleles):
+    """
+    Map each allele seen at a SNP to its genotype_012 code.
+
+    The reference allele is the first alphabetically and the alternate the
+    second; any further allele is reported as 1.
+    """
+    unique_alleles = sorted(alleles)
+
+    # Encode genotype:
+    # 0 = homozygous reference (ref/ref)
+    # 1 = heterozygous (ref/alt) - not applicable for inbred strains
+    # 2 = homozygous alternate (alt/alt)
+    # (1 shouldn't happen with biallelic SNPs, but handle gracefully)
+    codes = dict.fromkeys(unique_alleles, 1)
+    codes[unique_alleles[0]] = 0
+    if len(unique_alleles) > 1:
+        codes[unique_alleles[1]] = 2
+    return codes
+
+
+def _iter_genotype_records(snps, allele_codes):
+    """
+    Yield (strain, chr, pos, genotype_012) records for (chr, pos,
+    strain_alleles) SNPs.
+
+    Only a handful of alleles occur, so the codes for each distinct set of
+    alleles at a SNP are worked out once into allele_codes and reused. The
+    memo is keyed by that set, not by the per-strain pattern, so it stays
+    small however many strains or SNPs there are.
+    """
+    for chr_name, pos, strain_alleles in snps:
+        alleles = frozenset(strain_alleles.values())
+
+        codes = allele_codes.get(alleles)
+        if codes is None:
+            codes = allele_codes[alleles] = _allele_codes(alleles)
+
+        # strain_alleles is already in strain column order with missing
+        # strains left out
+        for strain_name, allele in strain_alleles.items():
+            yield strain_name, chr_name, pos, codes[allele]
+
+
 def convert_to_genotypes(snp_data, strain_columns):
     """
     Step 5: Convert alleles to numeric genotypes (0/1/2 encoding).
@@ -245,71 +390,44 @@ def convert_to_genotypes(snp_data, strain_columns):
     This encoding allows the simulator to model Mendelian inheritance.
 
     Args:
-        snp_data: List of SNP records from parse_mpd_csv()
+        snp_data: SNP columns from parse_mpd_csv()
         strain_columns: List of strain column names (already cleaned)
 
     Returns:
-        List of dicts with keys: strain, chr, pos, genotype_012
+        List of (strain, chr, pos, genotype_012) tuples, in output column order
     """
-    genotype_records = []
-
     print(f"\nConverting alleles to genotypes...")
 
-    # Strain names are already cleaned (no quotes)
-    strain_names = strain_columns
-    
-    for snp in snp_data:
-        chr_name = snp['chr']
-        pos = snp['pos']
-        strain_alleles = snp['strain_alleles']
-        
-        # Get all unique alleles at this position
-        all_alleles = list(strain_alleles.values())
-        unique_alleles = list(set(all_alleles))
-        
-        # Determine reference allele (most common, or first alphabetically)
-        if len(unique_alleles) == 1:
-            # All strains have same allele
-            ref_allele = unique_alleles[0]
-            alt_allele = None
-        else:
-            # Multiple alleles present
-            # Sort alphabetically to get consistent reference
-            unique_alleles.sort()
-            ref_allele = unique_alleles[0]
-            alt_allele = unique_alleles[1] if len(unique_alleles) > 1 else None
-        
-        # Convert each strain's allele to 0/1/2 genotype
-        for strain_name in strain_names:
-            if strain_name not in strain_alleles:
-                # Missing data - skip this strain for this SNP
-                continue
-            
-            allele = strain_alleles[strain_name]
-            
-            # Encode genotype:
-            # 0 = homozygous reference (ref/ref)
-            # 1 = heterozygous (ref/alt) - not applicable for inbred strains
-            # 2 = homozygous alternate (alt/alt)
-            if allele == ref_allele:
-                genotype = 0
-            elif allele == alt_allele:
-                genotype = 2
-            else:
-                # Shouldn't happen with biallelic SNPs, but handle gracefully
-                genotype = 1
-            
-            genotype_records.append({
-                'strain': strain_name,
-                'chr': chr_name,
-                'pos': pos,
-                'genotype_012': genotype
-            })
+    snps = zip(snp_data['chr'], snp_data['pos'], snp_data['strain_alleles'])
+    genotype_records = list(_iter_genotype_records(snps, {}))
 
     print(f"  Generated {len(genotype_records)} genotype record(s)")
     return genotype_records
 
 
+def _open_cleaned_output(output_path):
+    """
+    Open a cleaned CSV for writing with a large write buffer.
+
+    The output folder normally exists already (main creates it), so it is
+    only created when the open fails for lack of it, rather than checked on
+    every file.
+
+    Args:
+        output_path: Path to output CSV file
+
+    Returns:
+        Text file object opened for CSV writing
+    """
+    try:
+        return open(output_path, 'w', newline='', encoding='utf-8',
+                    buffering=WRITE_BUFFER_SIZE)
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        return open(output_path, 'w', newline='', encoding='utf-8',
+                    buffering=WRITE_BUFFER_SIZE)
+
+
 def save_cleaned_genotypes(genotype_records, output_path):
     """
     Step 6: Save cleaned genotype data to CSV.
@@ -318,19 +436,16 @@ def save_cleaned_genotypes(genotype_records, output_path):
         strain, chr, pos, genotype_012
 
     Args:
-        genotype_records: List of genotype dicts
+        genotype_records: List of (strain, chr, pos, genotype_012) tuples
         output_path: Path to output CSV file
     """
-    # Ensure output directory exists
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-
-    with open(output_path, 'w', newline='', encoding='utf-8') as f:
-        fieldnames = ['strain', 'chr', 'pos', 'genotype_012']
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+    with _open_cleaned_output(output_path) as f:
+        # Records are already tuples in column order, so csv.writer takes them
+        # as-is: no per-row dict lookups as with DictWriter
+        writer = csv.writer(f)
 
-        writer.writeheader()
-        for record in genotype_records:
-            writer.writerow(record)
+        writer.writerow(CLEANED_HEADER)
+        writer.writerows(genotype_records)
 
     print(f"\n✓ Saved {len(genotype_records)} record(s) to: {output_path}")
 
@@ -339,6 +454,10 @@ def process_file(raw_file, cleaned_dir='datasets/cleaned'):
     """
     Process a single raw file: parse, convert, and save.
 
+    Steps 4-6 run as one stream: SNPs are parsed, encoded and written in
+    chunks of STREAM_CHUNK_SIZE, so memory stays flat however large the
+    raw file is.
+
     Args:
         raw_file: Path to raw CSV file
         cleaned_dir: Path to cleaned data folder
@@ -346,23 +465,116 @@ def process_file(raw_file, cleaned_dir='datasets/cleaned'):
     Returns:
         Path to cleaned file, or None if processing failed
     """
-    # Step 4: Parse CSV
-    snp_data, strain_columns = parse_mpd_csv(raw_file)
+    print(f"\nParsing: {os.path.basename(raw_file)}")
 
-    if not snp_data:
-        print(f"  ERROR: No data extracted from {os.path.basename(raw_file)}")
-        return None
+    with open(raw_file, 'r', encoding='utf-8') as f:
+        # Step 4: Parse CSV (lazily, one chunk at a time)
+        strain_columns, snps = _read_mpd_snps(f)
+        chunk = list(itertools.islice(snps, STREAM_CHUNK_SIZE))
 
-    # Step 5: Convert to genotypes
-    genotype_records = convert_to_genotypes(snp_data, strain_columns)
+        if not chunk:
+            print(f"  Extracted 0 SNP(s)")
+            print(f"  ERROR: No data extracted from {os.path.basename(raw_file)}")
+            return None
 
-    # Step 6: Save output
-    output_path = get_cleaned_filename(raw_file, cleaned_dir)
-    save_cleaned_genotypes(genotype_records, output_path)
+        output_path = get_cleaned_filename(raw_file, cleaned_dir)
+
+        # Write to a temporary name and only move it into place once the
+        # whole raw file has been read: a partial cleaned_*.csv would
+        # otherwise count as "already processed" on the next run
+        partial_path = output_path + PARTIAL_SUFFIX
+
+        n_snps = 0
+        n_records = 0
+        allele_codes = {}
+        try:
+            with _open_cleaned_output(partial_path) as out:
+                writer = csv.writer(out)
+                writer.writerow(CLEANED_HEADER)
+
+                while chunk:
+                    # Step 5-6: Convert to genotypes and save
+                    records = list(_iter_genotype_records(chunk, allele_codes))
+                    writer.writerows(records)
+
+                    n_snps += len(chunk)
+                    n_records += len(records)
+                    chunk = list(itertools.islice(snps, STREAM_CHUNK_SIZE))
+
+            os.replace(partial_path, output_path)
+        except BaseException:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+            raise
+
+    print(f"  Extracted {n_snps} SNP(s)")
+    print(f"\nConverting alleles to genotypes...")
+    print(f"  Generated {n_records} genotype record(s)")
+    print(f"\n✓ Saved {n_records} record(s) to: {output_path}")
 
     return output_path
 
 
+def _process_file_buffered(raw_file, cleaned_dir):
+    """
+    Run process_file() in a worker process, capturing its progress output.
+
+    Returns:
+        Tuple of (cleaned path or None, captured output)
+    """
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        output_path = process_file(raw_file, cleaned_dir)
+    return output_path, buffer.getvalue()
+
+
+def process_files(raw_files, cleaned_dir='datasets/cleaned'):
+    """
+    Process several raw files, in parallel when there is more than one.
+
+    Files are independent and each writes its own cleaned_*.csv, so they run
+    in separate processes; each file's progress is printed in input order
+    once it finishes.
+
+    Args:
+        raw_files: List of raw CSV file paths
+        cleaned_dir: Path to cleaned data folder
+
+    Returns:
+        List of cleaned file paths (None for files that failed)
+    """
+    if len(raw_files) <= 1:
+        return [process_file(raw_file, cleaned_dir) for raw_file in raw_files]
+
+    output_paths = []
+    with ProcessPoolExecutor(max_workers=min(len(raw_files), os.cpu_count() or 1)) as executor:
+        for output_path, log in executor.map(_process_file_buffered, raw_files,
+                                             [cleaned_dir] * len(raw_files)):
+            print(log, end='')
+            output_paths.append(output_path)
+    return output_paths
+
+
+def _combined_key(cleaned_files):
+    """
+    Fingerprint the cleaned files that make up the combined dataset.
+
+    Built from each file's name, size and modification time, so it changes
+    whenever a file is added, removed or rewritten.
+
+    Args:
+        cleaned_files: List of cleaned CSV file paths
+
+    Returns:
+        MD5 hex digest string
+    """
+    key_md5 = hashlib.md5()
+    for cleaned_file in sorted(cleaned_files):
+        stat = os.stat(cleaned_file)
+        key_md5.update(f"{os.path.basename(cleaned_file)}\t{stat.st_size}\t{stat.st_mtime_ns}\n".encode('utf-8'))
+    return key_md5.hexdigest()
+
+
 def get_all_cleaned_data(cleaned_dir='datasets/cleaned'):
     """
     Combine all cleaned CSV files into a single dataset.
@@ -382,24 +594,56 @@ def get_all_cleaned_data(cleaned_dir='datasets/cleaned'):
     if len(cleaned_files) == 1:
         return cleaned_files[0]
 
-    # If multiple files, combine them
-    print(f"\nCombining {len(cleaned_files)} cleaned file(s)...")
+    combined_path = os.path.join(cleaned_dir, 'combined_all_strains.csv')
+    key_path = os.path.join(cleaned_dir, COMBINED_KEY_FILENAME)
 
-    all_records = []
-    for cleaned_file in cleaned_files:
-        with open(cleaned_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            all_records.extend(list(reader))
+    # Reuse the combined file if it was built from the same cleaned files
+    combined_key = _combined_key(cleaned_files)
+    if os.path.exists(combined_path):
+        try:
+            with open(key_path, 'r', encoding='utf-8') as f:
+                if f.read().strip() == combined_key:
+                    print(f"\n✓ Combined file is up to date: {combined_path}")
+                    return combined_path
+        except FileNotFoundError:
+            pass
 
-    # Save combined file
-    combined_path = os.path.join(cleaned_dir, 'combined_all_strains.csv')
-    with open(combined_path, 'w', newline='', encoding='utf-8') as f:
-        fieldnames = ['strain', 'chr', 'pos', 'genotype_012']
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(all_records)
+    # If multiple files, combine them
+    print(f"\nCombining {len(cleaned_files)} cleaned file(s)...")
 
-    print(f"✓ Combined {len(all_records)} record(s) to: {combined_path}")
+    # Cleaned files share one header, so their data lines are appended as-is
+    # rather than parsed and re-formatted; a file with a different header
+    # is re-mapped through DictReader/DictWriter instead
+    fieldnames = CLEANED_HEADER
+    n_records = 0
+
+    with open(combined_path, 'w', newline='', encoding='utf-8') as out:
+        header_line = ','.join(fieldnames)
+        out.write(header_line + '\r\n')
+
+        for cleaned_file in cleaned_files:
+            with open(cleaned_file, 'r', newline='', encoding='utf-8') as f:
+                if f.readline().rstrip('\r\n') != header_line:
+                    f.seek(0)
+                    rows = list(csv.DictReader(f))
+                    csv.DictWriter(out, fieldnames=fieldnames).writerows(rows)
+                    n_records += len(rows)
+                    continue
+
+                last = '\n'
+                for chunk in iter(lambda: f.read(COPY_CHUNK_SIZE), ''):
+                    out.write(chunk)
+                    n_records += chunk.count('\n')
+                    last = chunk[-1]
+                if last != '\n':
+                    # Last line had no terminator; end it before the next file
+                    out.write('\r\n')
+                    n_records += 1
+
+    with open(key_path, 'w', encoding='utf-8') as f:
+        f.write(combined_key + '\n')
+
+    print(f"✓ Combined {n_records} record(s) to: {combined_path}")
     return combined_path
 
 
@@ -455,8 +699,7 @@ def main():
     # Step 4-6: Process new files
     if new_files:
         print(f"\nProcessing {len(new_files)} new file(s)...")
-        for raw_file in new_files:
-            process_file(raw_file, cleaned_dir)
+        process_files(new_files, cleaned_dir)
     else:
         print("\n✓ All raw files have been processed!")
 